@@ -274,7 +274,12 @@ setuptools.setup(
     long_description_content_type="text/x-rst",
     download_url="https://github.com/enthought/traits",
     install_requires=["six"],
-    ext_modules=[setuptools.Extension("traits.ctraits", ["traits/ctraits.c"])],
+    ext_modules=[
+        setuptools.Extension("traits.ctraits", ["traits/ctraits.c"]),
+        setuptools.Extension(
+            "traits._fast_validate", ["traits/_fast_validate.c"]
+        ),
+    ],
     license="BSD",
     maintainer="ETS Developers",
     maintainer_email="enthought-dev@enthought.com",
@@ -0,0 +1,496 @@
+/******************************************************************************
+*
+*  Description: C based implementation of the 'validate' methods of the
+*               simple TraitHandler classes defined in 'trait_handlers.py'
+*               (TraitCoerceType, TraitCastType, TraitEnum, TraitMap,
+*               TraitInstance, TraitPrefixList, TraitPrefixMap)
+*
+*  Copyright (c) 2005, Enthought, Inc.
+*  All rights reserved.
+*
+*  This software is provided without warranty under the terms of the BSD
+*  license included in enthought/LICENSE.txt and may be redistributed only
+*  under the conditions described in the aforementioned license.  The license
+*  is also available online at http://www.enthought.com/licenses/BSD.txt
+*
+******************************************************************************/
+
+/*-----------------------------------------------------------------------------
+|  Includes:
++----------------------------------------------------------------------------*/
+
+#include "Python.h"
+
+/*-----------------------------------------------------------------------------
+|  Raises a TraitError by delegating to the handler's 'error' method (or to
+|  the specified alternate method, e.g. 'validate_failed').  The method is
+|  expected to raise, so this always returns NULL:
++----------------------------------------------------------------------------*/
+
+static PyObject *
+call_handler_error ( PyObject * handler, const char * method,
+                     PyObject * obj, PyObject * name, PyObject * value ) {
+
+    PyObject * result;
+
+    result = PyObject_CallMethod( handler, (char *) method, "(OOO)",
+                                  obj, name, value );
+    if ( result != NULL ) {
+        /* The error method is supposed to raise; guard against a broken
+           override that returns normally: */
+        Py_DECREF( result );
+        PyErr_SetString( PyExc_RuntimeError,
+                         "trait handler 'error' method did not raise" );
+    }
+
+    return NULL;
+}
+
+/*-----------------------------------------------------------------------------
+|  Verifies a Python value is of a specified coercable type
+|  (TraitCoerceType.validate):
++----------------------------------------------------------------------------*/
+
+static PyObject *
+fv_coerce ( PyObject * module, PyObject * args ) {
+
+    PyObject * handler, * obj, * name, * value;
+    PyObject * type_info, * type, * type2, * result;
+    Py_ssize_t i, n;
+
+    if ( !PyArg_UnpackTuple( args, "fv_coerce", 4, 4,
+                             &handler, &obj, &name, &value ) )
+        return NULL;
+
+    type_info = PyObject_GetAttrString( handler, "fast_validate" );
+    if ( type_info == NULL )
+        return NULL;
+
+    type = PyTuple_GET_ITEM( type_info, 1 );
+
+    /* If the value is already the desired type, then return it: */
+    if ( (PyObject *) Py_TYPE( value ) == type ) {
+        Py_DECREF( type_info );
+        Py_INCREF( value );
+        return value;
+    }
+
+    /* Else see if it is one of the coercable types: */
+    n = PyTuple_GET_SIZE( type_info );
+    for ( i = 2; i < n; i++ ) {
+        type2 = PyTuple_GET_ITEM( type_info, i );
+        if ( (PyObject *) Py_TYPE( value ) == type2 ) {
+            /* Return the coerced value: */
+            result = PyObject_CallFunctionObjArgs( type, value, NULL );
+            Py_DECREF( type_info );
+            return result;
+        }
+    }
+    Py_DECREF( type_info );
+
+    /* Otherwise, raise an exception: */
+    return call_handler_error( handler, "error", obj, name, value );
+}
+
+/*-----------------------------------------------------------------------------
+|  Verifies a Python value is of a specified (possibly castable) type
+|  (TraitCastType.validate):
++----------------------------------------------------------------------------*/
+
+static PyObject *
+fv_cast ( PyObject * module, PyObject * args ) {
+
+    PyObject * handler, * obj, * name, * value;
+    PyObject * type, * result;
+
+    if ( !PyArg_UnpackTuple( args, "fv_cast", 4, 4,
+                             &handler, &obj, &name, &value ) )
+        return NULL;
+
+    type = PyObject_GetAttrString( handler, "aType" );
+    if ( type == NULL )
+        return NULL;
+
+    /* If the value is already the desired type, then return it: */
+    if ( (PyObject *) Py_TYPE( value ) == type ) {
+        Py_DECREF( type );
+        Py_INCREF( value );
+        return value;
+    }
+
+    /* Else try to cast it to the specified type. Only the exceptions that
+       signal an invalid cast are converted into a TraitError: */
+    result = PyObject_CallFunctionObjArgs( type, value, NULL );
+    Py_DECREF( type );
+    if ( result != NULL )
+        return result;
+
+    if ( !PyErr_ExceptionMatches( PyExc_TypeError ) &&
+         !PyErr_ExceptionMatches( PyExc_ValueError ) &&
+         !PyErr_ExceptionMatches( PyExc_OverflowError ) )
+        return NULL;
+
+    PyErr_Clear();
+
+    return call_handler_error( handler, "error", obj, name, value );
+}
+
+/*-----------------------------------------------------------------------------
+|  Verifies a Python value is in a specified enumeration
+|  (TraitEnum.validate):
++----------------------------------------------------------------------------*/
+
+static PyObject *
+fv_enum ( PyObject * module, PyObject * args ) {
+
+    PyObject * handler, * obj, * name, * value;
+    PyObject * values;
+    int        contains;
+
+    if ( !PyArg_UnpackTuple( args, "fv_enum", 4, 4,
+                             &handler, &obj, &name, &value ) )
+        return NULL;
+
+    /* Use the frozenset of values when one is available (larger
+       enumerations of hashable values); unhashable values fall through to
+       the tuple scan below: */
+    values = PyObject_GetAttrString( handler, "_values_set" );
+    if ( values == NULL ) {
+        PyErr_Clear();
+    } else {
+        if ( values != Py_None ) {
+            contains = PySequence_Contains( values, value );
+            if ( contains > 0 ) {
+                Py_DECREF( values );
+                Py_INCREF( value );
+                return value;
+            }
+            if ( contains < 0 )
+                PyErr_Clear();
+        }
+        Py_DECREF( values );
+    }
+
+    values = PyObject_GetAttrString( handler, "values" );
+    if ( values == NULL )
+        return NULL;
+
+    contains = PySequence_Contains( values, value );
+    Py_DECREF( values );
+    if ( contains > 0 ) {
+        Py_INCREF( value );
+        return value;
+    }
+    if ( contains < 0 )
+        PyErr_Clear();
+
+    return call_handler_error( handler, "error", obj, name, value );
+}
+
+/*-----------------------------------------------------------------------------
+|  Verifies a Python value is in a specified map (i.e. dictionary)
+|  (TraitMap.validate):
++----------------------------------------------------------------------------*/
+
+static PyObject *
+fv_map ( PyObject * module, PyObject * args ) {
+
+    PyObject * handler, * obj, * name, * value;
+    PyObject * map;
+    int        contains;
+
+    if ( !PyArg_UnpackTuple( args, "fv_map", 4, 4,
+                             &handler, &obj, &name, &value ) )
+        return NULL;
+
+    map = PyObject_GetAttrString( handler, "map" );
+    if ( map == NULL )
+        return NULL;
+
+    contains = PyDict_Contains( map, value );
+    Py_DECREF( map );
+    if ( contains > 0 ) {
+        Py_INCREF( value );
+        return value;
+    }
+    if ( contains < 0 )
+        PyErr_Clear();
+
+    return call_handler_error( handler, "error", obj, name, value );
+}
+
+/*-----------------------------------------------------------------------------
+|  Verifies a Python value is an instance of a specified class
+|  (TraitInstance.validate for the non-adapting, resolved class case):
++----------------------------------------------------------------------------*/
+
+static PyObject *
+fv_instance ( PyObject * module, PyObject * args ) {
+
+    PyObject * handler, * obj, * name, * value;
+    PyObject * aClass, * allow_none;
+    int        rc;
+
+    if ( !PyArg_UnpackTuple( args, "fv_instance", 4, 4,
+                             &handler, &obj, &name, &value ) )
+        return NULL;
+
+    aClass = PyObject_GetAttrString( handler, "aClass" );
+    if ( aClass == NULL )
+        return NULL;
+
+    /* An exact type match is always valid: */
+    if ( (PyObject *) Py_TYPE( value ) == aClass ) {
+        Py_DECREF( aClass );
+        Py_INCREF( value );
+        return value;
+    }
+
+    if ( value == Py_None ) {
+        Py_DECREF( aClass );
+        allow_none = PyObject_GetAttrString( handler, "_allow_none" );
+        if ( allow_none == NULL )
+            return NULL;
+        rc = PyObject_IsTrue( allow_none );
+        Py_DECREF( allow_none );
+        if ( rc > 0 ) {
+            Py_INCREF( value );
+            return value;
+        }
+    } else {
+        rc = PyObject_IsInstance( value, aClass );
+        Py_DECREF( aClass );
+        if ( rc > 0 ) {
+            Py_INCREF( value );
+            return value;
+        }
+        if ( rc < 0 )
+            PyErr_Clear();
+    }
+
+    return call_handler_error( handler, "validate_failed", obj, name, value );
+}
+
+/*-----------------------------------------------------------------------------
+|  Verifies a Python value is in a specified prefix map (i.e. dictionary),
+|  delegating cache misses to the Python 'validate' method defined on the
+|  handler's class (TraitPrefixList/TraitPrefixMap.validate):
++----------------------------------------------------------------------------*/
+
+static PyObject *
+fv_prefix ( PyObject * args, const char * func_name,
+            const char * cache_name ) {
+
+    PyObject * handler, * obj, * name, * value;
+    PyObject * cache, * mapped_value, * validate, * result;
+
+    if ( !PyArg_UnpackTuple( args, func_name, 4, 4,
+                             &handler, &obj, &name, &value ) )
+        return NULL;
+
+    cache = PyObject_GetAttrString( handler, (char *) cache_name );
+    if ( cache == NULL )
+        return NULL;
+
+    if ( PyDict_CheckExact( cache ) ) {
+        mapped_value = PyDict_GetItem( cache, value );
+        if ( mapped_value != NULL ) {
+            Py_DECREF( cache );
+            Py_INCREF( mapped_value );
+            return mapped_value;
+        }
+        PyErr_Clear();
+    }
+    Py_DECREF( cache );
+
+    /* Fall back to the Python implementation for cache misses (which also
+       raises the appropriate TraitError for invalid values): */
+    validate = PyObject_GetAttrString( (PyObject *) Py_TYPE( handler ),
+                                       "validate" );
+    if ( validate == NULL )
+        return NULL;
+
+    result = PyObject_CallFunctionObjArgs( validate, handler, obj, name,
+                                           value, NULL );
+    Py_DECREF( validate );
+
+    return result;
+}
+
+static PyObject *
+fv_prefix_list ( PyObject * module, PyObject * args ) {
+
+    return fv_prefix( args, "fv_prefix_list", "values_" );
+}
+
+static PyObject *
+fv_prefix_map ( PyObject * module, PyObject * args ) {
+
+    return fv_prefix( args, "fv_prefix_map", "_map" );
+}
+
+/*-----------------------------------------------------------------------------
+|  Returns the (cached) TraitError exception type:
++----------------------------------------------------------------------------*/
+
+static PyObject * trait_error_type = NULL;
+
+static PyObject *
+get_trait_error ( void ) {
+
+    PyObject * module;
+
+    if ( trait_error_type == NULL ) {
+        module = PyImport_ImportModule( "traits.trait_errors" );
+        if ( module == NULL )
+            return NULL;
+        trait_error_type = PyObject_GetAttrString( module, "TraitError" );
+        Py_DECREF( module );
+    }
+
+    return trait_error_type;
+}
+
+/*-----------------------------------------------------------------------------
+|  Runs the TraitCompound.validate dispatch cascade: probe the validator
+|  memoized for the value's type, then walk the fast validators, and leave
+|  the slow validators (and error reporting) to the Python slow_validate:
++----------------------------------------------------------------------------*/
+
+static PyObject *
+fv_compound ( PyObject * module, PyObject * args ) {
+
+    PyObject * handler, * obj, * name, * value;
+    PyObject * trait_error, * cache, * validates, * cacheable;
+    PyObject * vtype, * validate, * result;
+    Py_ssize_t i, n;
+
+    if ( !PyArg_UnpackTuple( args, "fv_compound", 4, 4,
+                             &handler, &obj, &name, &value ) )
+        return NULL;
+
+    trait_error = get_trait_error();
+    if ( trait_error == NULL )
+        return NULL;
+
+    cache = PyObject_GetAttrString( handler, "_validate_cache" );
+    if ( cache == NULL )
+        return NULL;
+
+    vtype = (PyObject *) Py_TYPE( value );
+    if ( PyDict_CheckExact( cache ) ) {
+        validate = PyDict_GetItem( cache, vtype );
+        if ( validate != NULL ) {
+            /* PyDict_GetItem returns a borrowed reference, and the call
+               can re-enter and replace the cache slot while in flight: */
+            Py_INCREF( validate );
+            result = PyObject_CallFunctionObjArgs( validate, obj, name,
+                                                   value, NULL );
+            Py_DECREF( validate );
+            if ( result != NULL ) {
+                Py_DECREF( cache );
+                return result;
+            }
+            if ( !PyErr_ExceptionMatches( trait_error ) ) {
+                Py_DECREF( cache );
+                return NULL;
+            }
+            PyErr_Clear();
+        }
+    }
+
+    validates = PyObject_GetAttrString( handler, "validates" );
+    cacheable = PyObject_GetAttrString( handler, "_validate_cacheable" );
+    if ( (validates == NULL) || (cacheable == NULL) ||
+         !PyTuple_CheckExact( validates ) || !PyList_CheckExact( cacheable ) ) {
+        Py_XDECREF( validates );
+        Py_XDECREF( cacheable );
+        Py_DECREF( cache );
+        if ( !PyErr_Occurred() )
+            PyErr_SetString( PyExc_TypeError,
+                             "unexpected compound validator layout" );
+        return NULL;
+    }
+
+    n = PyTuple_GET_SIZE( validates );
+    for ( i = 0; i < n; i++ ) {
+        validate = PyTuple_GET_ITEM( validates, i );
+        result = PyObject_CallFunctionObjArgs( validate, obj, name, value,
+                                               NULL );
+        if ( result != NULL ) {
+            if ( PyObject_IsTrue( PyList_GET_ITEM( cacheable, i ) ) &&
+                 PyDict_CheckExact( cache ) &&
+                 (PyDict_Size( cache ) < 64) )
+                PyDict_SetItem( cache, vtype, validate );
+            Py_DECREF( validates );
+            Py_DECREF( cacheable );
+            Py_DECREF( cache );
+            return result;
+        }
+        if ( !PyErr_ExceptionMatches( trait_error ) ) {
+            Py_DECREF( validates );
+            Py_DECREF( cacheable );
+            Py_DECREF( cache );
+            return NULL;
+        }
+        PyErr_Clear();
+    }
+    Py_DECREF( validates );
+    Py_DECREF( cacheable );
+    Py_DECREF( cache );
+
+    return PyObject_CallMethod( handler, "slow_validate", "(OOO)",
+                                obj, name, value );
+}
+
+/*-----------------------------------------------------------------------------
+|  Module definition:
++----------------------------------------------------------------------------*/
+
+static PyMethodDef fast_validate_methods[] = {
+    { "fv_coerce",      (PyCFunction) fv_coerce,      METH_VARARGS,
+      PyDoc_STR( "fv_coerce(handler,object,name,value)" ) },
+    { "fv_cast",        (PyCFunction) fv_cast,        METH_VARARGS,
+      PyDoc_STR( "fv_cast(handler,object,name,value)" ) },
+    { "fv_enum",        (PyCFunction) fv_enum,        METH_VARARGS,
+      PyDoc_STR( "fv_enum(handler,object,name,value)" ) },
+    { "fv_map",         (PyCFunction) fv_map,         METH_VARARGS,
+      PyDoc_STR( "fv_map(handler,object,name,value)" ) },
+    { "fv_instance",    (PyCFunction) fv_instance,    METH_VARARGS,
+      PyDoc_STR( "fv_instance(handler,object,name,value)" ) },
+    { "fv_compound",    (PyCFunction) fv_compound,    METH_VARARGS,
+      PyDoc_STR( "fv_compound(handler,object,name,value)" ) },
+    { "fv_prefix_list", (PyCFunction) fv_prefix_list, METH_VARARGS,
+      PyDoc_STR( "fv_prefix_list(handler,object,name,value)" ) },
+    { "fv_prefix_map",  (PyCFunction) fv_prefix_map,  METH_VARARGS,
+      PyDoc_STR( "fv_prefix_map(handler,object,name,value)" ) },
+    { NULL, NULL },
+};
+
+#if PY_MAJOR_VERSION >= 3
+
+static struct PyModuleDef fast_validate_module = {
+    PyModuleDef_HEAD_INIT,
+    "_fast_validate",
+    "C based implementations of the TraitHandler 'validate' methods",
+    -1,
+    fast_validate_methods,
+};
+
+PyMODINIT_FUNC
+PyInit__fast_validate ( void ) {
+
+    return PyModule_Create( &fast_validate_module );
+}
+
+#else
+
+PyMODINIT_FUNC
+init_fast_validate ( void ) {
+
+    Py_InitModule3( "_fast_validate", fast_validate_methods,
+                    "C based implementations of the TraitHandler "
+                    "'validate' methods" );
+}
+
+#endif
@@ -0,0 +1,102 @@
+""" Tests that the trait handler classes which bind specialized
+    per-instance validate methods remain picklable (the bindings are
+    stripped on pickling and rebuilt on restore).
+"""
+
+import pickle
+import unittest
+
+from traits.api import TraitError
+from traits.trait_handlers import (
+    TraitCastType,
+    TraitCoerceType,
+    TraitCompound,
+    TraitEnum,
+    TraitFunction,
+    TraitInstance,
+    TraitMap,
+    TraitPrefixList,
+    TraitPrefixMap,
+    TraitRange,
+    TraitTuple,
+)
+
+
+class Dummy(object):
+    pass
+
+
+def validator_function(object, name, value):
+    if isinstance(value, int):
+        return value
+    raise TraitError("not an int")
+
+
+class HandlerPickleTestCase(unittest.TestCase):
+    def check_round_trip(self, handler, good, expected, bad):
+        restored = pickle.loads(pickle.dumps(handler))
+        self.assertEqual(restored.validate(None, "value", good), expected)
+        with self.assertRaises(TraitError):
+            restored.validate(None, "value", bad)
+
+    def test_coerce_type(self):
+        self.check_round_trip(TraitCoerceType(float), 3, 3.0, "x")
+
+    def test_cast_type(self):
+        self.check_round_trip(TraitCastType(int), "42", 42, "zz")
+
+    def test_enum(self):
+        self.check_round_trip(TraitEnum("a", "b"), "a", "a", "z")
+
+    def test_map(self):
+        self.check_round_trip(TraitMap({"yes": 1, "no": 0}), "yes", "yes", "q")
+
+    def test_instance(self):
+        handler = TraitInstance(Dummy, allow_none=False)
+        restored = pickle.loads(pickle.dumps(handler))
+        value = Dummy()
+        self.assertIs(restored.validate(None, "value", value), value)
+        with self.assertRaises(TraitError):
+            restored.validate(None, "value", 5)
+
+    def test_function(self):
+        self.check_round_trip(TraitFunction(validator_function), 7, 7, "x")
+
+    def test_tuple(self):
+        self.check_round_trip(
+            TraitTuple(int, str), (1, "a"), (1, "a"), (1, 2)
+        )
+
+    def test_compound(self):
+        handler = TraitCompound(TraitCoerceType(int), TraitEnum("a", "b"))
+        restored = pickle.loads(pickle.dumps(handler))
+        self.assertEqual(restored.validate(None, "value", "a"), "a")
+        self.assertEqual(restored.validate(None, "value", 3), 3)
+        with self.assertRaises(TraitError):
+            restored.validate(None, "value", "z")
+
+    def test_mapped_compound(self):
+        handler = TraitCompound(TraitMap({"y": 1}), TraitCastType(int))
+        restored = pickle.loads(pickle.dumps(handler))
+        self.assertTrue(restored.is_mapped)
+        self.assertEqual(restored.mapped_value("y"), 1)
+
+    def test_prefix_list(self):
+        self.check_round_trip(TraitPrefixList("yes", "no"), "y", "yes", "q")
+
+    def test_prefix_map(self):
+        self.check_round_trip(
+            TraitPrefixMap({"true": 1, "false": 0}), "tr", "true", "q"
+        )
+
+    def test_range_keeps_specialization(self):
+        # TraitRange binds a regular method, which pickles by reference
+        # and must survive the round trip:
+        restored = pickle.loads(pickle.dumps(TraitRange(0, 10)))
+        self.assertEqual(restored.validate(None, "value", 5), 5)
+        with self.assertRaises(TraitError):
+            restored.validate(None, "value", 50)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -368,3 +368,33 @@ class ListTestCase(unittest.TestCase):
         f.l = ["a", "c", "b", "d"]
         with self.assertRaises(TypeError):
             f.l.sort(cmp=lambda x, y: ord(x) - ord(y))
+
+
+class ValidateManyTestCase(unittest.TestCase):
+    def test_returns_validated_wrappers(self):
+        from traits.api import Trait
+        from traits.trait_handlers import TraitList, TraitListObject
+
+        class Hand(HasTraits):
+            cards = Trait([], TraitList(Trait(0), maxlen=3))
+
+        hand = Hand()
+        handler = hand.trait("cards").handler
+        results = handler.validate_many(hand, "cards", [[1], [2, 3]])
+        self.assertEqual([list(r) for r in results], [[1], [2, 3]])
+        for result in results:
+            self.assertIsInstance(result, TraitListObject)
+
+    def test_invalid_entry_raises(self):
+        from traits.api import Trait
+        from traits.trait_handlers import TraitList
+
+        class Hand(HasTraits):
+            cards = Trait([], TraitList(Trait(0), maxlen=3))
+
+        hand = Hand()
+        handler = hand.trait("cards").handler
+        with self.assertRaises(TraitError):
+            handler.validate_many(hand, "cards", [[1], [1, 2, 3, 4]])
+        with self.assertRaises(TraitError):
+            handler.validate_many(hand, "cards", [[1], "not-a-list"])
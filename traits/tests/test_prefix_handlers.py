@@ -0,0 +1,89 @@
+import unittest
+
+from traits.api import HasTraits, Trait, TraitError
+from traits.trait_handlers import TraitPrefixList, TraitPrefixMap
+
+
+class Person(HasTraits):
+    married = Trait("no", TraitPrefixList("yes", "no"))
+
+
+class Politician(HasTraits):
+    honest = Trait("so-so", TraitPrefixMap({"yes": 1, "no": 0, "so-so": 2}))
+
+
+class TraitPrefixListTestCase(unittest.TestCase):
+    def test_full_value(self):
+        person = Person()
+        person.married = "yes"
+        self.assertEqual(person.married, "yes")
+
+    def test_unique_prefix_is_completed(self):
+        person = Person()
+        person.married = "y"
+        self.assertEqual(person.married, "yes")
+        person.married = "ye"
+        self.assertEqual(person.married, "yes")
+
+    def test_invalid_value(self):
+        person = Person()
+        with self.assertRaises(TraitError):
+            person.married = "never"
+
+    def test_ambiguous_prefix(self):
+        handler = TraitPrefixList("yellow", "yes")
+        with self.assertRaises(TraitError):
+            handler.validate(None, "color", "ye")
+        self.assertEqual(handler.validate(None, "color", "yel"), "yellow")
+
+    def test_non_string_value(self):
+        person = Person()
+        with self.assertRaises(TraitError):
+            person.married = 0
+
+    def test_cache_does_not_grow_at_runtime(self):
+        values = ["key%03dsuffix" % i for i in range(300)]
+        handler = TraitPrefixList(values)
+        size = len(handler.values_)
+        # Every unambiguous prefix is precomputed, so validating (valid or
+        # invalid) values must not grow the lookup dictionary:
+        for i in range(len(values)):
+            self.assertEqual(
+                handler.validate(None, "value", "key%03d" % i), values[i]
+            )
+        with self.assertRaises(TraitError):
+            handler.validate(None, "value", "unknown")
+        self.assertEqual(len(handler.values_), size)
+
+    def test_key_that_is_a_prefix_of_another(self):
+        handler = TraitPrefixList("no", "none")
+        self.assertEqual(handler.validate(None, "value", "no"), "no")
+        self.assertEqual(handler.validate(None, "value", "non"), "none")
+
+
+class TraitPrefixMapTestCase(unittest.TestCase):
+    def test_prefix_maps_to_full_key(self):
+        politician = Politician()
+        politician.honest = "y"
+        self.assertEqual(politician.honest, "yes")
+        self.assertEqual(politician.honest_, 1)
+
+    def test_shadow_value_updates(self):
+        politician = Politician()
+        politician.honest = "s"
+        self.assertEqual(politician.honest, "so-so")
+        self.assertEqual(politician.honest_, 2)
+
+    def test_ambiguous_prefix(self):
+        politician = Politician()
+        with self.assertRaises(TraitError):
+            politician.honest = ""
+
+    def test_invalid_value(self):
+        politician = Politician()
+        with self.assertRaises(TraitError):
+            politician.honest = "maybe"
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -36,10 +36,13 @@ from __future__ import absolute_import
 import sys
 import re
 import copy
+import threading
 
 import six
 import six.moves as sm
 
+from operator import methodcaller
+
 from types import FunctionType, MethodType
 
 TypeType = type
@@ -63,6 +66,14 @@ from . import _py2to3
 
 from ._py2to3 import LONG_TYPE
 
+# The C implementations of the simple TraitHandler 'validate' methods are
+# optional; the pure Python implementations are used when the extension is
+# not available:
+try:
+    from . import _fast_validate
+except ImportError:
+    _fast_validate = None
+
 # Patched by 'traits.py' once class is defined!
 Trait = Event = None
 
@@ -82,6 +93,9 @@ RICH_COMPARE = 2
 
 RangeTypes = (int, LONG_TYPE, float)
 
+# Frozenset mirror of TypeTypes, for O(1) membership tests:
+_TYPE_TYPES_SET = frozenset(TypeTypes)
+
 CallableTypes = (FunctionType, MethodType)
 
 
@@ -196,6 +210,10 @@ class BaseTraitHandler(object):
           wider range of cases, such as interactions with other components.
     """
 
+    # No state of its own; lets subclasses declare __slots__ for their
+    # frequently read attributes:
+    __slots__ = ()
+
     default_value_type = UNSPECIFIED_DEFAULT_VALUE
     has_items = False
     is_mapped = False
@@ -354,6 +372,31 @@ class BaseTraitHandler(object):
         """
         return ()
 
+    def __getstate__(self):
+        """ Returns the handler's picklable state. A specialized
+            per-instance 'validate' binding (a C function or generated
+            code) cannot be pickled by reference, so it is dropped here and
+            rebuilt by __setstate__ via _rebind_validate(). Regular bound
+            methods (e.g. TraitRange's per-kind validators) are kept.
+        """
+        validate = self.__dict__.get("validate")
+        if (validate is None) or _picklable_method(self, validate):
+            return _handler_state(self, ())
+
+        return _handler_state(self, ("validate",))
+
+    def __setstate__(self, state):
+        for name, value in state.items():
+            setattr(self, name, value)
+        self._rebind_validate()
+
+    def _rebind_validate(self):
+        """ Recreates the specialized per-instance 'validate' binding (if
+            any) after unpickling. Overridden by the handlers that bind
+            one.
+        """
+        pass
+
 
 # -------------------------------------------------------------------------------
 #  'TraitType' (base class for class-based trait definitions:
@@ -744,6 +787,8 @@ class TraitHandler(BaseTraitHandler):
     is validate().
     """
 
+    __slots__ = ()
+
     def validate(self, object, name, value):
         """ Verifies whether a new value assigned to a trait attribute is valid.
 
@@ -1100,6 +1145,38 @@ class TraitString(TraitHandler):
         self._init()
 
 
+# -------------------------------------------------------------------------------
+#  'fast_validate' interning:
+# -------------------------------------------------------------------------------
+
+# Interning table for 'fast_validate' tuples. Many handlers produce
+# identical validation tuples (e.g. every TraitCastType(int) instance), and
+# the C dispatcher reads these on every assignment; sharing one tuple object
+# across equal handlers reduces per-handler memory and pointer chasing.
+# The table is bounded so that applications building handlers dynamically
+# cannot leak through it - beyond the bound, tuples are simply not shared:
+_INTERN_TABLE_SIZE = 1024
+
+_fast_validate_interned = {}
+
+
+def _intern_fast_validate(fast_validate):
+    """ Returns a canonical shared instance of the specified fast_validate
+        tuple. Tuples containing unhashable items (e.g. the dictionaries
+        used by the map handlers) are returned unchanged, as is anything
+        once the interning table is full.
+    """
+    try:
+        interned = _fast_validate_interned.get(fast_validate)
+        if interned is not None:
+            return interned
+        if len(_fast_validate_interned) < _INTERN_TABLE_SIZE:
+            _fast_validate_interned[fast_validate] = fast_validate
+        return fast_validate
+    except TypeError:
+        return fast_validate
+
+
 # -------------------------------------------------------------------------------
 #  'TraitCoerceType' class:
 # -------------------------------------------------------------------------------
@@ -1149,6 +1226,14 @@ class TraitCoerceType(TraitHandler):
     ============ =================
     """
 
+    __slots__ = (
+        "aType",
+        "fast_validate",
+        "_target_type",
+        "_coerce_types",
+        "__dict__",
+    )
+
     def __init__(self, aType):
         """ Creates a TraitCoerceType handler.
 
@@ -1170,21 +1255,59 @@ class TraitCoerceType(TraitHandler):
         try:
             self.fast_validate = CoercableTypes[aType]
         except:
-            self.fast_validate = (11, aType)
+            self.fast_validate = _intern_fast_validate((11, aType))
 
-    def validate(self, object, name, value):
-        fv = self.fast_validate
-        tv = type(value)
+        # Unpack the validation tuple once, so that validate() does not have
+        # to index (and re-slice) it on every assignment:
+        self._target_type = self.fast_validate[1]
+        self._coerce_types = self.fast_validate[2:]
+
+        self._rebind_validate()
+
+    def _rebind_validate(self):
+        if _fast_validate is not None:
+            self.validate = MethodType(_fast_validate.fv_coerce, self)
+        else:
+            self._specialize_validate()
+
+    def _specialize_validate(self):
+        """ Generates a validate() method with the target type and the
+            coercion types baked in as constants, unrolling the coercion
+            loop. The types are fixed when the handler is created, so the
+            generated method is just a chain of identity checks.
+        """
+        namespace = {"target": self._target_type}
+        source = [
+            "def validate(self, object, name, value):",
+            "    t = type(value)",
+            "    if t is target:",
+            "        return value",
+        ]
+        for i, coerce_type in enumerate(self._coerce_types):
+            if coerce_type is None:
+                continue
+            coerce_name = "coerce_%d" % i
+            namespace[coerce_name] = coerce_type
+            source.append("    if t is %s:" % coerce_name)
+            source.append("        return target(value)")
+        source.append("    self.error(object, name, value)")
+
+        exec("\n".join(source), namespace)
+        self.validate = MethodType(namespace["validate"], self)
+
+    def validate(self, object, name, value, _type=type):
+        tv = _type(value)
+        target = self._target_type
 
         # If the value is already the desired type, then return it:
-        if tv is fv[1]:
+        if tv is target:
             return value
 
         # Else see if it is one of the coercable types:
-        for typei in fv[2:]:
+        for typei in self._coerce_types:
             if tv is typei:
                 # Return the coerced value:
-                return fv[1](value)
+                return target(value)
 
         # Otherwise, raise an exception:
         self.error(object, name, value)
@@ -1221,6 +1344,15 @@ class TraitCoerceType(TraitHandler):
 #  'TraitCastType' class:
 # -------------------------------------------------------------------------------
 
+# Input types for which calling the given target type can never raise, so
+# that validate() can cast directly without setting up exception handling:
+_SAFE_CAST_INPUTS = {
+    int: (bool,),
+    float: (bool,),
+    complex: (bool, float),
+    str: (bool, int, float, complex),
+}
+
 
 class TraitCastType(TraitCoerceType):
     """Ensures that a value assigned to a trait attribute is of a specified
@@ -1261,6 +1393,8 @@ class TraitCastType(TraitCoerceType):
         >>>bill.cweight = '180' # OK, cast to float('180')
     """
 
+    __slots__ = ("_safe_casts",)
+
     def __init__(self, aType):
         """ Creates a TraitCastType handler.
 
@@ -1280,18 +1414,89 @@ class TraitCastType(TraitCoerceType):
         if not isinstance(aType, TypeType):
             aType = type(aType)
         self.aType = aType
-        self.fast_validate = (12, aType)
+        self.fast_validate = _intern_fast_validate((12, aType))
+        self._safe_casts = _SAFE_CAST_INPUTS.get(aType, ())
 
-    def validate(self, object, name, value):
+        self._rebind_validate()
+
+    def _rebind_validate(self):
+        if _fast_validate is not None:
+            self.validate = MethodType(_fast_validate.fv_cast, self)
+        else:
+            specialized = self._specialized_validates.get(self.aType)
+            if specialized is not None:
+                self.validate = getattr(self, specialized)
+
+    # Specialized validate methods for the common C implemented target
+    # types, which avoid the generic method's attribute loads and call the
+    # conversion directly for inputs known to be convertible:
+    _specialized_validates = {
+        int: "validate_int",
+        float: "validate_float",
+        complex: "validate_complex",
+        str: "validate_str",
+    }
+
+    def validate_int(self, object, name, value, _type=type):
+        tv = _type(value)
+        if tv is int:
+            return value
+        if tv is bool:
+            return int(value)
+        try:
+            return int(value)
+        except (TypeError, ValueError, OverflowError):
+            self.error(object, name, value)
+
+    def validate_float(self, object, name, value, _type=type):
+        tv = _type(value)
+        if tv is float:
+            return value
+        if tv is bool:
+            return float(value)
+        try:
+            return float(value)
+        except (TypeError, ValueError, OverflowError):
+            self.error(object, name, value)
+
+    def validate_complex(self, object, name, value, _type=type):
+        tv = _type(value)
+        if tv is complex:
+            return value
+        if (tv is float) or (tv is bool):
+            return complex(value)
+        try:
+            return complex(value)
+        except (TypeError, ValueError, OverflowError):
+            self.error(object, name, value)
+
+    def validate_str(self, object, name, value, _type=type):
+        tv = _type(value)
+        if tv is str:
+            return value
+        if tv in (bool, int, float, complex):
+            return str(value)
+        try:
+            return str(value)
+        except (TypeError, ValueError):
+            self.error(object, name, value)
+
+    def validate(self, object, name, value, _type=type):
+        aType = self.aType
+        tv = _type(value)
 
         # If the value is already the desired type, then return it:
-        if type(value) is self.aType:
+        if tv is aType:
             return value
 
+        # Cast directly when the conversion is known not to raise:
+        if tv in self._safe_casts:
+            return aType(value)
+
         # Else try to cast it to the specified type:
         try:
-            return self.aType(value)
-        except:
+            return aType(value)
+        except (TypeError, ValueError, OverflowError):
             self.error(object, name, value)
 
 
@@ -1308,6 +1513,8 @@ class ThisClass(TraitHandler):
        and **self**, and the elements of ListThis.
     """
 
+    __slots__ = ("fast_validate", "__dict__")
+
     def __init__(self, allow_none=False):
         """Creates a ThisClass handler.
 
@@ -1324,14 +1531,22 @@ class ThisClass(TraitHandler):
         else:
             self.fast_validate = (2,)
 
-    def validate(self, object, name, value):
-        if isinstance(value, object.__class__):
+    def validate(self, object, name, value, _type=type):
+        # Check for an exact type match first, since it avoids the MRO walk
+        # performed by isinstance() for subclass instances:
+        aClass = object.__class__
+        if (_type(value) is aClass) or isinstance(value, aClass):
             return value
 
         self.validate_failed(object, name, value)
 
-    def validate_none(self, object, name, value):
-        if isinstance(value, object.__class__) or (value is None):
+    def validate_none(self, object, name, value, _type=type):
+        aClass = object.__class__
+        if (
+            (_type(value) is aClass)
+            or isinstance(value, aClass)
+            or (value is None)
+        ):
             return value
 
         self.validate_failed(object, name, value)
@@ -1364,6 +1579,11 @@ class ThisClass(TraitHandler):
 # Mapping from 'adapt' parameter values to 'fast validate' values
 AdaptMap = {"no": -1, "yes": 0, "default": 1}
 
+# Cache of classes resolved by 'TraitInstance.find_class', keyed on the
+# (module name, class name) pair. Many Instance('pkg.Class') handlers name
+# the same class; each should only pay for the import machinery once:
+_class_cache = {}
+
 
 class TraitInstance(ThisClass):
     """Ensures that trait attribute values belong to a specified Python class
@@ -1386,6 +1606,8 @@ class TraitInstance(ThisClass):
     (i.e., no coercion is performed).
     """
 
+    __slots__ = ("aClass", "_allow_none", "adapt", "module")
+
     def __init__(self, aClass, allow_none=True, adapt="no", module=""):
         """Creates a TraitInstance handler.
 
@@ -1430,47 +1652,83 @@ class TraitInstance(ThisClass):
 
     def set_fast_validate(self):
         if self.adapt < 0:
-            fast_validate = [1, self.aClass]
+            vt = 0 if self.aClass in _TYPE_TYPES_SET else 1
             if self._allow_none:
-                fast_validate = [1, None, self.aClass]
-            if self.aClass in TypeTypes:
-                fast_validate[0] = 0
-            self.fast_validate = tuple(fast_validate)
+                fast_validate = (vt, None, self.aClass)
+            else:
+                fast_validate = (vt, self.aClass)
+            self.fast_validate = _intern_fast_validate(fast_validate)
+            self._rebind_validate()
         else:
-            self.fast_validate = (
-                19,
-                self.aClass,
-                self.adapt,
-                self._allow_none,
+            self.fast_validate = _intern_fast_validate(
+                (19, self.aClass, self.adapt, self._allow_none)
             )
 
-    def validate(self, object, name, value):
+    def _rebind_validate(self):
+        if (self.adapt >= 0) or (
+            getattr(self, "fast_validate", None) is None
+        ):
+            return
+        if _fast_validate is not None:
+            self.validate = MethodType(_fast_validate.fv_instance, self)
+        else:
+            self._specialize_validate()
+
+    def _specialize_validate(self):
+        """ Binds a validate() method specialized for a resolved class in
+            the non-adapting case, which no longer needs to check whether
+            the class is still an unresolved string on each call.
+        """
+        aClass = self.aClass
+        allow_none = self._allow_none
 
-        from traits.adaptation.api import adapt
+        def validate(object, name, value):
+            if (
+                (type(value) is aClass)
+                or ((value is None) and allow_none)
+                or isinstance(value, aClass)
+            ):
+                return value
+            self.validate_failed(object, name, value)
+
+        self.validate = validate
+
+    def validate(self, object, name, value, _type=type):
+        # An exact type match is always valid, regardless of the adaptation
+        # mode, and avoids the MRO walk performed by isinstance():
+        aClass = self.aClass
+        if _type(value) is aClass:
+            return value
 
         if value is None:
             if self._allow_none:
                 return value
-            else:
-                self.validate_failed(object, name, value)
+            self.validate_failed(object, name, value)
 
-        if isinstance(self.aClass, six.string_types):
+        if isinstance(aClass, six.string_types):
+            # Resolving the class binds a validate method specialized for
+            # the resolved class, so simply re-dispatch through it:
             self.resolve_class(object, name, value)
+            return self.validate(object, name, value)
 
         if self.adapt < 0:
-            if isinstance(value, self.aClass):
+            if isinstance(value, aClass):
                 return value
-        elif self.adapt == 0:
-            try:
-                return adapt(value, self.aClass)
-            except:
-                pass
         else:
-            # fixme: The 'None' value is not really correct. It should return
-            # the default value for the trait, but the handler does not have
-            # any way to know this currently. Since the 'fast validate' code
-            # does the correct thing, this should not normally be a problem.
-            return adapt(value, self.aClass, None)
+            from traits.adaptation.api import adapt
+
+            if self.adapt == 0:
+                try:
+                    return adapt(value, aClass)
+                except:
+                    pass
+            else:
+                # fixme: The 'None' value is not really correct. It should
+                # return the default value for the trait, but the handler
+                # does not have any way to know this currently. Since the
+                # 'fast validate' code does the correct thing, this should
+                # not normally be a problem.
+                return adapt(value, aClass, None)
 
         self.validate_failed(object, name, value)
 
@@ -1509,8 +1767,9 @@ class TraitInstance(ThisClass):
         self.set_fast_validate()
         trait = object.base_trait(name)
         handler = trait.handler
-        if (handler is not self) and hasattr(handler, "item_trait"):
-            trait = handler.item_trait
+        item_trait = getattr(handler, "item_trait", None)
+        if (handler is not self) and (item_trait is not None):
+            trait = item_trait
         trait.set_validate(self.fast_validate)
 
     def find_class(self, aClass):
@@ -1520,7 +1779,17 @@ class TraitInstance(ThisClass):
             module = aClass[:col]
             aClass = aClass[col + 1 :]
 
-        theClass = getattr(sys.modules.get(module), aClass, None)
+        theClass = _class_cache.get((module, aClass))
+        if theClass is not None:
+            return theClass
+
+        mod = sys.modules.get(module)
+        if mod is None:
+            theClass = None
+        else:
+            # Read the module's __dict__ directly, which skips the
+            # descriptor machinery involved in a getattr on a module object:
+            theClass = mod.__dict__.get(aClass)
         if (theClass is None) and (col >= 0):
             try:
                 mod = __import__(module, globals=globals(), level=1)
@@ -1530,6 +1799,9 @@ class TraitInstance(ThisClass):
             except:
                 pass
 
+        if theClass is not None:
+            _class_cache[(module, aClass)] = theClass
+
         return theClass
 
     def validate_class(self, aClass):
@@ -1666,6 +1938,8 @@ class TraitFunction(TraitHandler):
     Trait() function.
     """
 
+    __slots__ = ("aFunc", "fast_validate", "__dict__")
+
     def __init__(self, aFunc):
         """ Creates a TraitFunction handler.
 
@@ -1687,6 +1961,23 @@ class TraitFunction(TraitHandler):
             raise TraitError("Argument must be callable.")
         self.aFunc = aFunc
         self.fast_validate = (13, aFunc)
+        self._rebind_validate()
+
+    def _rebind_validate(self):
+        """ Binds a validate() method with the validator function and error
+            reporter captured as free variables, saving two attribute loads
+            on every call.
+        """
+        aFunc = self.aFunc
+        error = self.error
+
+        def validate(object, name, value):
+            try:
+                return aFunc(object, name, value)
+            except TraitError:
+                error(object, name, value)
+
+        self.validate = validate
 
     def validate(self, object, name, value):
         try:
@@ -1707,6 +1998,52 @@ class TraitFunction(TraitHandler):
 #  'TraitEnum' class:
 # -------------------------------------------------------------------------------
 
+# Numba's 'njit', or False once an attempt to import it has failed, so that
+# the import is only attempted (and its absence logged) once:
+_numba_njit = None
+
+
+def _compile_numeric_enum_validator(values):
+    """ Returns a Numba compiled membership test for an enumeration whose
+        values are all ints or floats, or None when Numba is not available
+        or compilation fails. The compiled test is a chain of native
+        compares with no Python object overhead.
+    """
+    global _numba_njit
+
+    if _numba_njit is None:
+        try:
+            from numba import njit
+
+            _numba_njit = njit
+        except ImportError:
+            logger.debug(
+                "Numba is not available; numeric enumerations use the "
+                "interpreted membership test."
+            )
+            _numba_njit = False
+
+    if _numba_njit is False:
+        return None
+
+    namespace = {}
+    terms = []
+    for i, v in enumerate(values):
+        name = "v%d" % i
+        namespace[name] = v
+        terms.append("(x == %s)" % name)
+    exec("def _validate(x):\n    return " + " or ".join(terms), namespace)
+
+    try:
+        validator = _numba_njit(cache=True)(namespace["_validate"])
+        # Force compilation now, so that a Numba failure cannot surface
+        # later as a spurious TraitError during an assignment:
+        validator(values[0])
+    except Exception:
+        return None
+
+    return validator
+
 
 class TraitEnum(TraitHandler):
     """ Ensures that a value assigned to a trait attribute is a member of a
@@ -1716,6 +2053,15 @@ class TraitEnum(TraitHandler):
     that take a list of possible values
     """
 
+    __slots__ = (
+        "values",
+        "fast_validate",
+        "_values_set",
+        "_numeric_validate",
+        "_info_cache",
+        "__dict__",
+    )
+
     def __init__(self, *values):
         """ Creates a TraitEnum handler.
 
@@ -1751,15 +2097,72 @@ class TraitEnum(TraitHandler):
         if (len(values) == 1) and (type(values[0]) in SequenceTypes):
             values = values[0]
         self.values = tuple(values)
+        # Not interned: enum value tuples are arbitrary user data, and
+        # pinning each distinct one for the process lifetime would leak in
+        # applications that build enumerations dynamically:
         self.fast_validate = (5, self.values)
 
-    def validate(self, object, name, value):
+        # For larger enumerations, membership is tested against a frozenset,
+        # which is O(1) instead of a linear scan of the tuple. Small tuples
+        # are faster to scan directly, and some members may be unhashable:
+        self._info_cache = None
+        self._values_set = None
+        if len(self.values) > 3:
+            try:
+                self._values_set = frozenset(self.values)
+            except TypeError:
+                pass
+
+        # For all-numeric enumerations, membership can optionally be tested
+        # by a Numba compiled chain of native compares. Only the Python
+        # validate() consults it, so do not pay the JIT compile when the C
+        # validator is bound instead:
+        self._numeric_validate = None
+        if (
+            (_fast_validate is None)
+            and (len(self.values) > 0)
+            and all(type(v) in (int, float) for v in self.values)
+        ):
+            self._numeric_validate = _compile_numeric_enum_validator(
+                self.values
+            )
+
+        self._rebind_validate()
+
+    def _rebind_validate(self):
+        if _fast_validate is not None:
+            self.validate = MethodType(_fast_validate.fv_enum, self)
+
+    def validate(self, object, name, value, _type=type):
+        numeric = self._numeric_validate
+        if (numeric is not None) and (_type(value) in (int, float)):
+            try:
+                valid = numeric(value)
+            except OverflowError:
+                # Ints outside the compiled (int64) range fall through to
+                # the interpreted membership test:
+                pass
+            else:
+                if valid:
+                    return value
+                self.error(object, name, value)
+
+        values_set = self._values_set
+        if values_set is not None:
+            try:
+                if value in values_set:
+                    return value
+            except TypeError:
+                # Unhashable values can still be compared against the tuple:
+                pass
         if value in self.values:
             return value
         self.error(object, name, value)
 
     def info(self):
-        return " or ".join([repr(x) for x in self.values])
+        if self._info_cache is None:
+            self._info_cache = " or ".join(repr(x) for x in self.values)
+        return self._info_cache
 
     def get_editor(self, trait):
         from traitsui.api import EnumEditor
@@ -1772,6 +2175,108 @@ class TraitEnum(TraitHandler):
         )
 
 
+# -------------------------------------------------------------------------------
+#  Prefix trie helpers used by 'TraitPrefixList' and 'TraitPrefixMap':
+# -------------------------------------------------------------------------------
+
+
+def _handler_state(handler, exclude):
+    """ Returns a picklable mapping of the handler's attributes - both the
+        __slots__ based and the __dict__ based ones - omitting the names in
+        *exclude* (typically the unpicklable bound validators).
+    """
+    state = {}
+    for klass in type(handler).__mro__:
+        for name in getattr(klass, "__slots__", ()):
+            if (name != "__dict__") and (name not in exclude):
+                try:
+                    state[name] = getattr(handler, name)
+                except AttributeError:
+                    pass
+    for name, value in handler.__dict__.items():
+        if name not in exclude:
+            state[name] = value
+
+    return state
+
+
+def _picklable_method(handler, method):
+    """ Returns whether the bound method can be pickled by reference, i.e.
+        it is a regular method reachable by name on the handler's class
+        (such as TraitRange's per-kind validators), as opposed to a bound C
+        function or generated code.
+    """
+    func = getattr(method, "__func__", None)
+
+    return (func is not None) and (
+        getattr(type(handler), func.__name__, None) is func
+    )
+
+
+def _build_prefix_trie(values):
+    """ Builds a trie (nested dictionaries keyed on single characters) for
+        the specified strings. A terminal node stores the full string under
+        the None key (which cannot collide with a character).
+    """
+    trie = {}
+    for key in values:
+        node = trie
+        for ch in key:
+            node = node.setdefault(ch, {})
+        node[None] = key
+
+    return trie
+
+
+def _populate_unique_prefixes(trie, cache):
+    """ Adds a (prefix, string) entry to *cache* for every prefix of the
+        trie's strings that unambiguously identifies a single string.
+        Existing cache entries (the full strings) are not overwritten.
+
+        The walk is an explicit-stack post-order pass (states are visited
+        children-first so each node's string count is available when the
+        node itself is processed), so the trie depth - the length of the
+        longest string - is not limited by the interpreter recursion limit.
+    """
+    counts = {}
+    stack = [(trie, "", False)]
+    while stack:
+        node, prefix, processed = stack.pop()
+        if not processed:
+            stack.append((node, prefix, True))
+            for ch, child in node.items():
+                if ch is not None:
+                    stack.append((child, prefix + ch, False))
+            continue
+
+        key = node.get(None)
+        count = 0 if key is None else 1
+        sole = key
+        for ch, child in node.items():
+            if ch is None:
+                continue
+            child_count, child_key = counts[id(child)]
+            count += child_count
+            if sole is None:
+                sole = child_key
+        counts[id(node)] = (count, sole)
+
+        if count == 1:
+            cache.setdefault(prefix, sole)
+
+
+def _unique_prefix_cache(values):
+    """ Returns a dictionary mapping each of the specified strings, and each
+        unambiguous prefix of them, to the full string it identifies.
+    """
+    cache = {}
+    for key in values:
+        cache[key] = key
+    _populate_unique_prefixes(_build_prefix_trie(values), cache)
+
+    return cache
+
+
 # -------------------------------------------------------------------------------
 #  'TraitPrefixList' class:
 # -------------------------------------------------------------------------------
@@ -1809,6 +2314,9 @@ class TraitPrefixList(TraitHandler):
 
     """
 
+    __slots__ = ("values", "values_", "fast_validate", "_info_cache",
+                 "__dict__")
+
     def __init__(self, *values):
         """ Creates a TraitPrefixList handler.
 
@@ -1826,34 +2334,33 @@ class TraitPrefixList(TraitHandler):
         if (len(values) == 1) and (type(values[0]) in SequenceTypes):
             values = values[0]
         self.values = values[:]
-        self.values_ = values_ = {}
-        for key in values:
-            values_[key] = key
+        self._info_cache = None
+        # Pre-populate the lookup dictionary with every unambiguous prefix
+        # of every value, so that validation is a single dictionary probe
+        # and never needs to fall back to a scan. The memory cost is
+        # bounded by the total length of the values:
+        self.values_ = values_ = _unique_prefix_cache(values)
         self.fast_validate = (10, values_, self.validate)
 
+        self._rebind_validate()
+
+    def _rebind_validate(self):
+        if _fast_validate is not None:
+            self.validate = MethodType(_fast_validate.fv_prefix_list, self)
+
     def validate(self, object, name, value):
         try:
-            if value not in self.values_:
-                match = None
-                n = len(value)
-                for key in self.values:
-                    if value == key[:n]:
-                        if match is not None:
-                            match = None
-                            break
-                        match = key
-                if match is None:
-                    self.error(object, name, value)
-                self.values_[value] = match
             return self.values_[value]
-        except:
+        except (KeyError, TypeError):
             self.error(object, name, value)
 
     def info(self):
-        return (
-            " or ".join([repr(x) for x in self.values])
-            + " (or any unique prefix)"
-        )
+        if self._info_cache is None:
+            self._info_cache = (
+                " or ".join(repr(x) for x in self.values)
+                + " (or any unique prefix)"
+            )
+        return self._info_cache
 
     def get_editor(self, trait):
         from traitsui.api import EnumEditor
@@ -1861,11 +2368,7 @@ class TraitPrefixList(TraitHandler):
         return EnumEditor(values=self, cols=trait.cols or 3)
 
     def __getstate__(self):
-        result = self.__dict__.copy()
-        if "fast_validate" in result:
-            del result["fast_validate"]
-
-        return result
+        return _handler_state(self, ("fast_validate", "validate"))
 
 
 # -------------------------------------------------------------------------------
@@ -1908,6 +2411,9 @@ class TraitMap(TraitHandler):
 
     is_mapped = True
 
+    __slots__ = ("map", "fast_validate", "_info_cache", "_shadow_names",
+                 "__dict__")
+
     def __init__(self, map):
         """ Creates a TraitMap handler.
 
@@ -1919,13 +2425,22 @@ class TraitMap(TraitHandler):
             trait attribute.
         """
         self.map = map
+        self._info_cache = None
+        self._shadow_names = {}
         self.fast_validate = (6, map)
 
+        self._rebind_validate()
+
+    def _rebind_validate(self):
+        if _fast_validate is not None:
+            self.validate = MethodType(_fast_validate.fv_map, self)
+
     def validate(self, object, name, value):
         try:
             if value in self.map:
                 return value
-        except:
+        except TypeError:
+            # Unhashable values are simply not valid keys:
             pass
 
         self.error(object, name, value)
@@ -1934,16 +2449,24 @@ class TraitMap(TraitHandler):
         return self.map[value]
 
     def post_setattr(self, object, name, value):
+        # Cache the shadow attribute name, so that repeated assignments do
+        # not build a new string each time:
+        shadow_names = self._shadow_names
+        shadow = shadow_names.get(name)
+        if shadow is None:
+            shadow = shadow_names[name] = name + "_"
         try:
-            setattr(object, name + "_", self.mapped_value(value))
+            setattr(object, shadow, self.map[value])
         except:
             # We don't need a fancy error message, because this exception
             # should always be caught by a TraitCompound handler:
             raise TraitError("Unmappable")
 
     def info(self):
-        keys = sorted(repr(x) for x in self.map.keys())
-        return " or ".join(keys)
+        if self._info_cache is None:
+            keys = sorted(repr(x) for x in self.map.keys())
+            self._info_cache = " or ".join(keys)
+        return self._info_cache
 
     def get_editor(self, trait):
         from traitsui.api import EnumEditor
@@ -1976,6 +2499,8 @@ class TraitPrefixMap(TraitMap):
     'yes', 'false', or 'no', and maps them to 1 or 0.
     """
 
+    __slots__ = ("_map",)
+
     def __init__(self, map):
         """Creates a TraitPrefixMap handler.
 
@@ -1987,32 +2512,31 @@ class TraitPrefixMap(TraitMap):
             the shadow trait attribute.
         """
         self.map = map
-        self._map = _map = {}
-        for key in map.keys():
-            _map[key] = key
+        self._info_cache = None
+        self._shadow_names = {}
+        # As for TraitPrefixList, map every unambiguous prefix of every key
+        # up front so that validation is a single dictionary probe:
+        self._map = _map = _unique_prefix_cache(list(map.keys()))
         self.fast_validate = (10, _map, self.validate)
 
+        self._rebind_validate()
+
+    def _rebind_validate(self):
+        if _fast_validate is not None:
+            self.validate = MethodType(_fast_validate.fv_prefix_map, self)
+
     def validate(self, object, name, value):
         try:
-            if value not in self._map:
-                match = None
-                n = len(value)
-                for key in self.map.keys():
-                    if value == key[:n]:
-                        if match is not None:
-                            match = None
-                            break
-                        match = key
-                if match is None:
-                    self.error(object, name, value)
-                self._map[value] = match
             return self._map[value]
-        except:
+        except (KeyError, TypeError):
             self.error(object, name, value)
 
     def info(self):
         return super(TraitPrefixMap, self).info() + " (or any unique prefix)"
 
+    def __getstate__(self):
+        return _handler_state(self, ("fast_validate", "validate"))
+
 
 # -------------------------------------------------------------------------------
 #  'TraitExpression' class:
@@ -2048,6 +2572,29 @@ class TraitExpression(TraitHandler):
 #  'TraitCompound' class:
 # -------------------------------------------------------------------------------
 
+# Pushes the info() dispatch of the join in TraitCompound.info to C:
+_info_caller = methodcaller("info")
+
+# Maximum number of value types memoized per compound handler:
+_DISPATCH_CACHE_SIZE = 64
+
+
+def _type_sound_handler(handler):
+    """ Returns whether the handler accepts or rejects a value based on its
+        type alone. Only such handlers may safely be skipped when a later
+        validator has been memoized for a value's type (see
+        TraitCompound.validate); a value-dependent handler (e.g. TraitEnum)
+        could accept specific values of the same type and takes precedence.
+
+        An adapting TraitInstance does not qualify: its verdict depends on
+        the global adaptation registry, which can gain a factory at any
+        time. Nor does a bare ThisClass, whose verdict depends on the
+        object being assigned to, not just the value.
+    """
+    return (type(handler) is TraitCoerceType) or (
+        isinstance(handler, TraitInstance) and (handler.adapt < 0)
+    )
+
 
 class TraitCompound(TraitHandler):
     """ Provides a logical-OR combination of other trait handlers.
@@ -2065,6 +2612,31 @@ class TraitCompound(TraitHandler):
 
     """
 
+    __slots__ = (
+        "handlers",
+        "validates",
+        "slow_validates",
+        "fast_validate",
+        "is_mapped",
+        "has_items",
+        "reversable",
+        "mapped_handlers",
+        "post_setattrs",
+        "post_setattr",
+        "_validate_cacheable",
+        "_slow_cacheable",
+        "_validate_cache",
+        "_slow_validate_cache",
+        "_post_setattr_cacheable",
+        "_post_setattr_cache",
+        "_info_cache",
+        "_full_info_cache",
+        "_full_info_fns",
+        "_static_full_info",
+        "_setup_fp",
+        "__dict__",
+    )
+
     def __init__(self, *handlers):
         """ Creates a TraitCompound handler.
 
@@ -2080,19 +2652,36 @@ class TraitCompound(TraitHandler):
         self.set_validate()
 
     def set_validate(self):
+        # set_validate is re-run externally when a nested handler resolves
+        # (see BaseInstance.resolve_class), so the fingerprint covers both
+        # the handler identities and their current fast_validate tuples;
+        # when neither changed, the tables below would come out identical:
+        fingerprint = tuple(
+            (id(handler), getattr(handler, "fast_validate", None))
+            for handler in self.handlers
+        )
+        if fingerprint == getattr(self, "_setup_fp", None):
+            return
+        self._setup_fp = fingerprint
+
         self.is_mapped = False
         self.has_items = False
         self.reversable = True
         post_setattrs = []
+        post_setattr_handlers = []
         mapped_handlers = []
         validates = []
         fast_validates = []
         slow_validates = []
 
+        validate_handlers = []
+        slow_handlers = []
+
         for handler in self.handlers:
             fv = getattr(handler, "fast_validate", None)
             if fv is not None:
                 validates.append(handler.validate)
+                validate_handlers.append(handler)
                 if fv[0] == 7:
                     # If this is a nested complex fast validator, expand its
                     # contents and adds its list to our list:
@@ -2102,10 +2691,12 @@ class TraitCompound(TraitHandler):
                     fast_validates.append(fv)
             else:
                 slow_validates.append(handler.validate)
+                slow_handlers.append(handler)
 
             post_setattr = getattr(handler, "post_setattr", None)
             if post_setattr is not None:
                 post_setattrs.append(post_setattr)
+                post_setattr_handlers.append(handler)
 
             if handler.is_mapped:
                 self.is_mapped = True
@@ -2116,85 +2707,245 @@ class TraitCompound(TraitHandler):
             if handler.has_items:
                 self.has_items = True
 
-        self.validates = validates
-        self.slow_validates = slow_validates
+        # Tuples iterate slightly faster than lists and make the frozen
+        # configuration explicit:
+        self.validates = tuple(validates)
+        self.slow_validates = tuple(slow_validates)
+
+        # The winning validator for a value type is memoized, but a cached
+        # probe may only bypass the validators ahead of the winner if all
+        # of them are type-sound (their verdict depends only on the type):
+        sound = True
+        cacheable = []
+        for handler in validate_handlers + slow_handlers:
+            cacheable.append(sound)
+            if not _type_sound_handler(handler):
+                sound = False
+        n_fast = len(validate_handlers)
+        self._validate_cacheable = cacheable[:n_fast]
+        self._slow_cacheable = cacheable[n_fast:]
+        self._validate_cache = {}
+        self._slow_validate_cache = {}
+
+        # The same memoization (and soundness rule) for _post_setattr. In
+        # practice the mapped handlers are all value-dependent, so only a
+        # leading one is ever memoized:
+        sound = True
+        ps_cacheable = []
+        for handler in post_setattr_handlers:
+            ps_cacheable.append(sound)
+            if not _type_sound_handler(handler):
+                sound = False
+        self._post_setattr_cacheable = ps_cacheable
+        self._post_setattr_cache = {}
+
+        # The info strings never change once the handlers are known; they
+        # are rebuilt for every error message otherwise. full_info() can
+        # only be cached when every sub-handler uses the input-independent
+        # default implementation (which delegates to info()):
+        self._info_cache = None
+        self._full_info_cache = None
+        self._full_info_fns = tuple(
+            handler.full_info for handler in self.handlers
+        )
+
+        # Run the dispatch cascade in C when the extension is available; it
+        # shares the memoization dictionary and falls back to the Python
+        # slow_validate for the slow validators and error reporting:
+        if _fast_validate is not None:
+            self.validate = MethodType(_fast_validate.fv_compound, self)
+        self._static_full_info = all(
+            type(handler).full_info is BaseTraitHandler.full_info
+            for handler in self.handlers
+        )
 
         if self.is_mapped:
-            self.mapped_handlers = mapped_handlers
-        elif hasattr(self, "mapped_handlers"):
-            del self.mapped_handlers
+            self.mapped_handlers = tuple(mapped_handlers)
+        else:
+            self.mapped_handlers = None
 
         # If there are any fast validators, then we create a 'complex' fast
         # validator that composites them:
         if len(fast_validates) > 0:
+            # Drop duplicate validator descriptors (two sub-handlers can
+            # contribute identical tuples), shortening the C-level walk.
+            # Order is preserved, so the dispatch semantics do not change;
+            # unhashable descriptors (e.g. containing a map dictionary)
+            # are simply kept:
+            seen = set()
+            unique_validates = []
+            for fv in fast_validates:
+                try:
+                    if fv in seen:
+                        continue
+                    seen.add(fv)
+                except TypeError:
+                    pass
+                unique_validates.append(fv)
+            fast_validates = unique_validates
+
             # If there are any 'slow' validators, add a special handler at
             # the end of the fast validator list to handle them:
             if len(slow_validates) > 0:
                 fast_validates.append((8, self))
             # Create the 'complex' fast validator:
             self.fast_validate = (7, tuple(fast_validates))
-        elif hasattr(self, "fast_validate"):
-            del self.fast_validate
+        else:
+            self.fast_validate = None
 
         if len(post_setattrs) > 0:
-            self.post_setattrs = post_setattrs
+            self.post_setattrs = tuple(post_setattrs)
             self.post_setattr = self._post_setattr
-        elif hasattr(self, "post_setattr"):
-            del self.post_setattr
+        else:
+            self.post_setattrs = None
+            self.post_setattr = None
+
+    def __getstate__(self):
+        # Everything derived from the handlers list - including the bound
+        # sub-handler validate methods, which may be unpicklable C
+        # functions - is rebuilt by set_validate() on restore:
+        return _handler_state(
+            self,
+            (
+                "validate",
+                "validates",
+                "slow_validates",
+                "fast_validate",
+                "post_setattr",
+                "post_setattrs",
+                "mapped_handlers",
+                "_validate_cacheable",
+                "_slow_cacheable",
+                "_validate_cache",
+                "_slow_validate_cache",
+                "_post_setattr_cacheable",
+                "_post_setattr_cache",
+                "_info_cache",
+                "_full_info_cache",
+                "_full_info_fns",
+                "_static_full_info",
+                "_setup_fp",
+            ),
+        )
+
+    def _rebind_validate(self):
+        self.set_validate()
+
+    def invalidate(self):
+        """ Forces the next set_validate() call to rebuild the dispatch
+            tables, even if the handler list appears unchanged (e.g. when
+            a sub-handler was mutated in place).
+        """
+        self._setup_fp = None
 
     def validate(self, object, name, value):
-        for validate in self.validates:
+        # Probe the validator that last succeeded for this value type
+        # first, avoiding the exception churn of the full cascade:
+        cache = self._validate_cache
+        validate = cache.get(type(value))
+        if validate is not None:
             try:
                 return validate(object, name, value)
             except TraitError:
                 pass
+
+        cacheable = self._validate_cacheable
+        for i, validate in enumerate(self.validates):
+            try:
+                result = validate(object, name, value)
+            except TraitError:
+                continue
+            if cacheable[i] and (len(cache) < _DISPATCH_CACHE_SIZE):
+                cache[type(value)] = validate
+            return result
+
         return self.slow_validate(object, name, value)
 
     def slow_validate(self, object, name, value):
-        for validate in self.slow_validates:
+        cache = self._slow_validate_cache
+        validate = cache.get(type(value))
+        if validate is not None:
             try:
                 return validate(object, name, value)
             except TraitError:
                 pass
+
+        cacheable = self._slow_cacheable
+        for i, validate in enumerate(self.slow_validates):
+            try:
+                result = validate(object, name, value)
+            except TraitError:
+                continue
+            if cacheable[i] and (len(cache) < _DISPATCH_CACHE_SIZE):
+                cache[type(value)] = validate
+            return result
+
         self.error(object, name, value)
 
     def full_info(self, object, name, value):
+        if self._static_full_info:
+            if self._full_info_cache is None:
+                self._full_info_cache = " or ".join(
+                    f(object, name, value) for f in self._full_info_fns
+                )
+            return self._full_info_cache
+
         return " or ".join(
-            [x.full_info(object, name, value) for x in self.handlers]
+            f(object, name, value) for f in self._full_info_fns
         )
 
     def info(self):
-        return " or ".join([x.info() for x in self.handlers])
+        if self._info_cache is None:
+            self._info_cache = " or ".join(
+                map(_info_caller, self.handlers)
+            )
+        return self._info_cache
 
     def mapped_value(self, value):
         for handler in self.mapped_handlers:
             try:
                 return handler.mapped_value(value)
-            except:
+            except Exception:
+                # A mapped handler signals an unmappable value with an
+                # exception (e.g. the KeyError from its map lookup); try
+                # the next one. Unlike a bare except, this does not
+                # swallow SystemExit/KeyboardInterrupt:
                 pass
         return value
 
     def _post_setattr(self, object, name, value):
-        for post_setattr in self.post_setattrs:
+        cache = self._post_setattr_cache
+        post_setattr = cache.get(type(value))
+        if post_setattr is not None:
             try:
                 post_setattr(object, name, value)
                 return
             except TraitError:
                 pass
+
+        cacheable = self._post_setattr_cacheable
+        for i, post_setattr in enumerate(self.post_setattrs):
+            try:
+                post_setattr(object, name, value)
+            except TraitError:
+                continue
+            if cacheable[i] and (len(cache) < _DISPATCH_CACHE_SIZE):
+                cache[type(value)] = post_setattr
+            return
         setattr(object, name + "_", value)
 
     def get_editor(self, trait):
         from traitsui.api import TextEditor, CompoundEditor
 
-        the_editors = [x.get_editor(trait) for x in self.handlers]
-        text_editor = TextEditor()
-        count = 0
+        # Only a single TextEditor is kept (several sub-handlers fall back
+        # to one, and duplicates add nothing to the compound editor):
         editors = []
-        for editor in the_editors:
-            if isinstance(text_editor, editor.__class__):
-                count += 1
-                if count > 1:
+        text_seen = False
+        for editor in [x.get_editor(trait) for x in self.handlers]:
+            if isinstance(editor, TextEditor):
+                if text_seen:
                     continue
+                text_seen = True
             editors.append(editor)
 
         return CompoundEditor(editors=editors)
@@ -2229,6 +2980,15 @@ class TraitTuple(TraitHandler):
     strings, 'Hearts', 'Diamonds', 'Spades', or 'Clubs'.
     """
 
+    __slots__ = (
+        "types",
+        "fast_validate",
+        "_validators",
+        "_full_info_cache",
+        "_static_full_info",
+        "__dict__",
+    )
+
     def __init__(self, *args):
         r""" Creates a TraitTuple handler.
 
@@ -2248,25 +3008,89 @@ class TraitTuple(TraitHandler):
         """
         self.types = tuple([trait_from(arg) for arg in args])
         self.fast_validate = (9, self.types)
+        self._rebind_validate()
+
+        # As for TraitCompound, the description can be cached when every
+        # item handler's full_info is input-independent:
+        self._full_info_cache = None
+        self._static_full_info = all(
+            (t.handler is None)
+            or (type(t.handler).full_info is BaseTraitHandler.full_info)
+            for t in self.types
+        )
+
+    def __getstate__(self):
+        # The pre-bound item validators may be unpicklable C functions;
+        # both they and the generated validate() are rebuilt from the item
+        # traits on restore:
+        return _handler_state(self, ("validate", "_validators"))
+
+    def _rebind_validate(self):
+        self._validators = tuple(
+            None if t.handler is None else t.handler.validate
+            for t in self.types
+        )
+        self._specialize_validate()
+
+    def _specialize_validate(self):
+        """ Generates a validate() method specialized for the tuple's arity,
+            with each item's validator bound in directly, replacing the
+            generic version's enumerate loop, intermediate list and final
+            tuple() copy with a single tuple display.
+        """
+        validators = self._validators
+        n = len(validators)
+        if (n > 8) or any(v is None for v in validators):
+            # Item traits without a validate method accept anything, and
+            # the generic loop already handles them; unusually wide tuples
+            # are not worth the generated code:
+            return
+
+        namespace = {
+            "isinstance": isinstance,
+            "len": len,
+            "TraitError": TraitError,
+        }
+        items = []
+        for i, validator in enumerate(validators):
+            namespace["v%d" % i] = validator
+            items.append("v%d(object, name, value[%d])" % (i, i))
+        tuple_expr = "(%s,)" % ", ".join(items) if n else "()"
+        source = (
+            "def validate(self, object, name, value):\n"
+            "    try:\n"
+            "        if isinstance(value, tuple) and (len(value) == %d):\n"
+            "            return %s\n"
+            "    except TraitError:\n"
+            "        pass\n"
+            "    self.error(object, name, value)" % (n, tuple_expr)
+        )
+        exec(source, namespace)
+        self.validate = MethodType(namespace["validate"], self)
 
     def validate(self, object, name, value):
-        try:
-            if isinstance(value, tuple):
-                types = self.types
-                if len(value) == len(types):
-                    values = []
-                    for i, type in enumerate(types):
-                        values.append(
-                            type.handler.validate(object, name, value[i])
-                        )
-                    return tuple(values)
-        except:
-            pass
+        if isinstance(value, tuple) and (len(value) == len(self.types)):
+            try:
+                # Preallocate the result list: index-assigning avoids the
+                # growth reallocations list.append incurs at these arities:
+                values = [None] * len(value)
+                for i, (validate, item) in enumerate(
+                    zip(self._validators, value)
+                ):
+                    if validate is not None:
+                        item = validate(object, name, item)
+                    values[i] = item
+                return tuple(values)
+            except TraitError:
+                pass
 
         self.error(object, name, value)
 
     def full_info(self, object, name, value):
-        return "a tuple of the form: (%s)" % (
+        if self._static_full_info and (self._full_info_cache is not None):
+            return self._full_info_cache
+
+        result = "a tuple of the form: (%s)" % (
             ", ".join(
                 [
                     self._trait_info(type, object, name, value)
@@ -2274,6 +3098,10 @@ class TraitTuple(TraitHandler):
                 ]
             )
         )
+        if self._static_full_info:
+            self._full_info_cache = result
+
+        return result
 
     def _trait_info(self, type, object, name, value):
         handler = type.handler
@@ -2336,6 +3164,20 @@ class TraitListEvent(object):
 #  'TraitList' class:
 # -------------------------------------------------------------------------------
 
+# Optional Numba compiled length-bound check for TraitList.validate. When
+# Numba is unavailable this is None and the comparison is done inline (a
+# Python fallback function would cost more than the comparison itself):
+try:
+    from numba import njit
+
+    @njit(cache=True)
+    def _len_ok(n, lo, hi):
+        return lo <= n <= hi
+
+
+except ImportError:
+    _len_ok = None
+
 
 class TraitList(TraitHandler):
     """ Ensures that a value assigned to a trait attribute is a list containing
@@ -2361,6 +3203,15 @@ class TraitList(TraitHandler):
     list.
     """
 
+    __slots__ = (
+        "item_trait",
+        "minlen",
+        "maxlen",
+        "has_items",
+        "_size_str",
+        "__dict__",
+    )
+
     info_trait = None
     default_value_type = TRAIT_LIST_OBJECT_DEFAULT_VALUE
     _items_event = None
@@ -2393,37 +3244,91 @@ class TraitList(TraitHandler):
         self.maxlen = max(minlen, maxlen)
         self.has_items = has_items
 
+        # The size part of the description only depends on the (fixed)
+        # length bounds, so derive it once instead of in every full_info
+        # call (which runs on every error message):
+        if self.minlen == 0:
+            if self.maxlen == six.MAXSIZE:
+                self._size_str = "items"
+            else:
+                self._size_str = "at most %d items" % self.maxlen
+        else:
+            if self.maxlen == six.MAXSIZE:
+                self._size_str = "at least %d items" % self.minlen
+            else:
+                self._size_str = "from %s to %s items" % (
+                    self.minlen,
+                    self.maxlen,
+                )
+
+        # Most list traits declare no length bounds at all; skip the bound
+        # check entirely for them:
+        if (self.minlen == 0) and (self.maxlen == six.MAXSIZE):
+            self.validate = self.validate_unbounded
+
     def clone(self):
         return TraitList(
             self.item_trait, self.minlen, self.maxlen, self.has_items
         )
 
+    # Set to TraitListObject once it is defined (at the bottom of this
+    # module), so that validate() reads it with a class-attribute load
+    # instead of a global lookup:
+    _TraitListObject = None
+
     def validate(self, object, name, value):
-        if isinstance(value, list) and (
-            self.minlen <= len(value) <= self.maxlen
-        ):
-            return TraitListObject(self, object, name, value)
+        if isinstance(value, list):
+            list_object = self._TraitListObject
+            # Re-assigning the wrapper that already belongs to this trait
+            # (e.g. object.foo = object.foo) needs no new TraitListObject:
+            # its contents were validated when they entered the wrapper.
+            if (
+                (type(value) is list_object)
+                and (getattr(value, "trait", None) is self)
+                and (value.name == name)
+                and (value.object() is object)
+            ):
+                return value
+            n = len(value)
+            if (
+                (self.minlen <= n <= self.maxlen)
+                if (_len_ok is None)
+                else _len_ok(n, self.minlen, self.maxlen)
+            ):
+                return list_object(self, object, name, value)
+
+        self.error(object, name, value)
+
+    def validate_unbounded(self, object, name, value):
+        if isinstance(value, list):
+            list_object = self._TraitListObject
+            if (
+                (type(value) is list_object)
+                and (getattr(value, "trait", None) is self)
+                and (value.name == name)
+                and (value.object() is object)
+            ):
+                return value
+            return list_object(self, object, name, value)
 
         self.error(object, name, value)
 
+    def validate_many(self, object, name, values):
+        """ Validates a sequence of lists in one call, returning a list of
+            the corresponding TraitListObject wrappers. Useful when
+            hydrating many list values at once.
+        """
+        validate = self.validate
+        return [validate(object, name, value) for value in values]
+
     def full_info(self, object, name, value):
-        if self.minlen == 0:
-            if self.maxlen == six.MAXSIZE:
-                size = "items"
-            else:
-                size = "at most %d items" % self.maxlen
-        else:
-            if self.maxlen == six.MAXSIZE:
-                size = "at least %d items" % self.minlen
-            else:
-                size = "from %s to %s items" % (self.minlen, self.maxlen)
         handler = self.item_trait.handler
         if handler is None:
             info = ""
         else:
             info = " which are %s" % handler.full_info(object, name, value)
 
-        return "a list of %s%s" % (size, info)
+        return "a list of %s%s" % (self._size_str, info)
 
     def get_editor(self, trait):
         from traits.traits import list_editor
@@ -2434,13 +3339,23 @@ class TraitList(TraitHandler):
         return items_event()
 
 
+# Lock guarding the lazy construction of the '_items_event' singletons:
+_items_event_lock = threading.Lock()
+
+
 def items_event():
-    if TraitList._items_event is None:
-        TraitList._items_event = Event(
-            TraitListEvent, is_base=False
-        ).as_ctrait()
+    # Double-checked locking: the hot path stays a single class-attribute
+    # read, while concurrent first calls cannot both construct the event:
+    event = TraitList._items_event
+    if event is None:
+        with _items_event_lock:
+            if TraitList._items_event is None:
+                TraitList._items_event = Event(
+                    TraitListEvent, is_base=False
+                ).as_ctrait()
+            event = TraitList._items_event
 
-    return TraitList._items_event
+    return event
 
 
 # -------------------------------------------------------------------------------
@@ -3178,6 +4093,17 @@ class TraitDict(TraitHandler):
     be floats (i.e., their most recently recorded weight).
     """
 
+    __slots__ = (
+        "key_trait",
+        "value_trait",
+        "has_items",
+        "key_handler",
+        "value_handler",
+        "_full_info_cache",
+        "_static_full_info",
+        "__dict__",
+    )
+
     info_trait = None
     default_value_type = TRAIT_DICT_OBJECT_DEFAULT_VALUE
     _items_event = None
@@ -3217,18 +4143,48 @@ class TraitDict(TraitHandler):
             handler = handler.clone()
             handler.has_items = False
         self.value_handler = handler
+        self.key_handler = self.key_trait.handler
+
+        # Cache the description when neither handler's full_info depends
+        # on its inputs (the default implementation delegates to info()):
+        self._full_info_cache = None
+        self._static_full_info = (
+            (self.key_handler is None)
+            or (
+                type(self.key_handler).full_info
+                is BaseTraitHandler.full_info
+            )
+        ) and (
+            (handler is None)
+            or (type(handler).full_info is BaseTraitHandler.full_info)
+        )
 
     def clone(self):
         return TraitDict(self.key_trait, self.value_trait, self.has_items)
 
+    # Set to TraitDictObject once it is defined (see TraitList):
+    _TraitDictObject = None
+
     def validate(self, object, name, value):
         if isinstance(value, dict):
-            return TraitDictObject(self, object, name, value)
+            dict_object = self._TraitDictObject
+            # See TraitList.validate: the trait's own wrapper is reused:
+            if (
+                (type(value) is dict_object)
+                and (getattr(value, "trait", None) is self)
+                and (value.name == name)
+                and (value.object() is object)
+            ):
+                return value
+            return dict_object(self, object, name, value)
         self.error(object, name, value)
 
     def full_info(self, object, name, value):
+        if self._static_full_info and (self._full_info_cache is not None):
+            return self._full_info_cache
+
         extra = ""
-        handler = self.key_trait.handler
+        handler = self.key_handler
         if handler is not None:
             extra = " with keys which are %s" % handler.full_info(
                 object, name, value
@@ -3242,7 +4198,11 @@ class TraitDict(TraitHandler):
             extra += " values which are %s" % handler.full_info(
                 object, name, value
             )
-        return "a dictionary%s" % extra
+        result = "a dictionary%s" % extra
+        if self._static_full_info:
+            self._full_info_cache = result
+
+        return result
 
     def get_editor(self, trait):
         if self.editor is None:
@@ -3253,12 +4213,16 @@ class TraitDict(TraitHandler):
         return self.editor
 
     def items_event(self):
-        if TraitDict._items_event is None:
-            TraitDict._items_event = Event(
-                TraitDictEvent, is_base=False
-            ).as_ctrait()
+        event = TraitDict._items_event
+        if event is None:
+            with _items_event_lock:
+                if TraitDict._items_event is None:
+                    TraitDict._items_event = Event(
+                        TraitDictEvent, is_base=False
+                    ).as_ctrait()
+                event = TraitDict._items_event
 
-        return TraitDict._items_event
+        return event
 
 
 # -------------------------------------------------------------------------------
@@ -3507,6 +4471,11 @@ from . import ctraits
 
 ctraits._list_classes(TraitListObject, TraitSetObject, TraitDictObject)
 
+# Resolve the forward references from the container handlers to their
+# wrapper classes (defined above, after the handlers themselves):
+TraitList._TraitListObject = TraitListObject
+TraitDict._TraitDictObject = TraitDictObject
+
 
 def _adapt_wrapper(*args, **kw):
     # We need this wrapper to defer the import of 'adapt' and avoid a circular